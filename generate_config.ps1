@@ -1,8 +1,8 @@
 # Generate Claude Desktop Configuration
 # This script creates the correct configuration file with absolute paths
 
-Write-Host "MCP Weather Server - Configuration Generator" -ForegroundColor Cyan
-Write-Host "=============================================" -ForegroundColor Cyan
+Write-Host "MCP Servers - Configuration Generator" -ForegroundColor Cyan
+Write-Host "=====================================" -ForegroundColor Cyan
 Write-Host ""
 
 # Get current directory
@@ -11,10 +11,11 @@ if (-not $projectPath) {
     $projectPath = (Get-Location).Path
 }
 
-$weatherPyPath = Join-Path $projectPath "weather.py"
+# Combined weather + NBA server
+$serverPyPath = Join-Path $projectPath "server.py"
 
 Write-Host "Project path: $projectPath" -ForegroundColor Yellow
-Write-Host "weather.py path: $weatherPyPath" -ForegroundColor Yellow
+Write-Host "server.py path: $serverPyPath" -ForegroundColor Yellow
 Write-Host ""
 
 # Find Python executable
@@ -40,9 +41,9 @@ Write-Host ""
 # Create configuration object
 $configObject = @{
     mcpServers = @{
-        weather = @{
+        "mcp-tests" = @{
             command = $pythonPath
-            args    = @($weatherPyPath)
+            args    = @($serverPyPath)
         }
     }
 }
@@ -0,0 +1,124 @@
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+import httpx
+from mcp.server.fastmcp import FastMCP
+
+# Use orjson for faster JSON decoding if available
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Use uvloop's faster event loop if available (not supported on Windows)
+try:
+    import uvloop
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
+logger = logging.getLogger(__name__)
+
+# Retry transient failures with exponential backoff
+MAX_RETRIES = 3
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Shared HTTP client, created lazily so it binds to the server's event loop
+_client: httpx.AsyncClient | None = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared keep-alive client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=httpx.Timeout(30.0, connect=5.0),
+        )
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared client if it has been created."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Close the shared HTTP client when the server shuts down."""
+    try:
+        yield
+    finally:
+        await close_client()
+
+
+def retry_delay(response: httpx.Response | None, attempt: int) -> float:
+    """Return the backoff delay, honoring a numeric Retry-After header."""
+    if response is not None:
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return min(float(retry_after), 30.0)
+    return float(2 ** attempt)
+
+
+async def fetch_json(
+    url: str,
+    semaphore: asyncio.Semaphore,
+    headers: dict[str, str] | None = None,
+) -> tuple[httpx.Response, Any] | None:
+    """GET a JSON resource with retries, returning (response, decoded body).
+
+    The semaphore caps concurrent requests to one host so chained tool calls
+    don't trip its rate limits; a slot is held only while a request is in
+    flight, not during retry backoff. The body is None for a 304 Not Modified
+    or an empty response. Failures are logged and return None.
+    """
+    client = get_client()
+    for attempt in range(MAX_RETRIES):
+        retrying = attempt < MAX_RETRIES - 1
+        try:
+            async with semaphore:
+                response = await client.get(url, headers=headers)
+            if response.status_code == 304:
+                return response, None
+            if response.status_code in RETRY_STATUS_CODES and retrying:
+                delay = retry_delay(response, attempt)
+                logger.warning(f"HTTP {response.status_code} for {url}, retrying in {delay:.0f}s")
+                await asyncio.sleep(delay)
+                continue
+            response.raise_for_status()
+            if not response.content:
+                return response, None
+            return response, orjson.loads(response.content) if HAS_ORJSON else response.json()
+        except httpx.HTTPStatusError as e:
+            logger.error(f"HTTP error {e.response.status_code} for {url}: {e.response.text[:200]}")
+            return None
+        except httpx.RequestError as e:
+            # A timeout already used the full timeout budget, so don't repeat it
+            if retrying and not isinstance(e, httpx.TimeoutException):
+                delay = retry_delay(None, attempt)
+                logger.warning(f"Request error for {url}: {e}, retrying in {delay:.0f}s")
+                await asyncio.sleep(delay)
+                continue
+            logger.error(f"Request error for {url}: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Unexpected error for {url}: {e}")
+            return None
+
+
+def run_server(server: FastMCP) -> None:
+    """Run an MCP server over stdio, on uvloop when it is installed."""
+    if HAS_UVLOOP:
+        # uvloop.run avoids the event loop policy API deprecated in Python 3.14
+        uvloop.run(server.run_stdio_async())
+    else:
+        server.run(transport="stdio")
@@ -1,12 +1,28 @@
+import asyncio
 import logging
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import lru_cache
+from operator import attrgetter
 from typing import Any
 
-import httpx
 from mcp.server.fastmcp import FastMCP
 
+from httpclient import fetch_json, lifespan, run_server
+
+# Use ciso8601 for faster timestamp parsing if available
+try:
+    from ciso8601 import parse_datetime
+    HAS_CISO8601 = True
+except ImportError:
+    HAS_CISO8601 = False
+
+
 # Initialize FastMCP server
-mcp = FastMCP("nba-scores")
+mcp = FastMCP("nba-scores", lifespan=lifespan)
 
 # Set up logging to stderr (important for stdio servers)
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
@@ -14,24 +30,84 @@ logger = logging.getLogger(__name__)
 
 # Constants
 BALLDONTLIE_API_BASE = "https://www.balldontlie.io/api/v1"
+DATE_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+# Per-host request limit, see httpclient.fetch_json
+_semaphore = asyncio.Semaphore(8)
+
+
+# In-process LRU response cache: url -> (expires_at, data, etag, last_modified)
+MAX_CACHE_ENTRIES = 256
+_cache: OrderedDict[str, tuple[float, dict[str, Any], str | None, str | None]] = OrderedDict()
+
+
+def _cache_ttl(url: str) -> float:
+    """Return how long (in seconds) a response for this URL stays fresh."""
+    if "/teams" in url:
+        # The team list practically never changes
+        return 86400.0
+    if f"dates[]={datetime.now().date()}" in url:
+        # Today's scoreboard updates while games are in progress
+        return 60.0
+    return 300.0
+
+
+def _cache_store(url: str, entry: tuple[float, dict[str, Any], str | None, str | None]) -> None:
+    """Store a cache entry, evicting the least recently used ones past the size cap."""
+    _cache[url] = entry
+    _cache.move_to_end(url)
+    while len(_cache) > MAX_CACHE_ENTRIES:
+        _cache.popitem(last=False)
 
 
 async def make_api_request(url: str) -> dict[str, Any] | None:
     """Make a request to the balldontlie API with proper error handling."""
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(url, timeout=30.0)
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error {e.response.status_code} for {url}: {e.response.text[:200]}")
-            return None
-        except httpx.RequestError as e:
-            logger.error(f"Request error for {url}: {e}")
-            return None
-        except Exception as e:
-            logger.error(f"Unexpected error for {url}: {e}")
-            return None
+    cached = _cache.get(url)
+    if cached:
+        _cache.move_to_end(url)
+        if time.monotonic() < cached[0]:
+            return cached[1]
+    
+    # Revalidate a stale entry with a conditional GET instead of refetching it
+    headers = {}
+    if cached:
+        _, _, etag, last_modified = cached
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+    
+    result = await fetch_json(url, _semaphore, headers)
+    if result is None:
+        return None
+    
+    response, data = result
+    if response.status_code == 304 and cached:
+        _cache_store(url, (time.monotonic() + _cache_ttl(url), *cached[1:]))
+        return cached[1]
+    if data is None:
+        return None
+    
+    _cache_store(url, (
+        time.monotonic() + _cache_ttl(url),
+        data,
+        response.headers.get("ETag"),
+        response.headers.get("Last-Modified"),
+    ))
+    return data
+
+
+@lru_cache(maxsize=4096)
+def _format_game_date(date: str) -> str:
+    """Format an API timestamp for display, falling back to the raw string."""
+    try:
+        if HAS_CISO8601:
+            dt = parse_datetime(date)
+        else:
+            dt = datetime.fromisoformat(date.replace("Z", "+00:00"))
+        return dt.strftime("%B %d, %Y at %I:%M %p")
+    except ValueError:
+        return date
 
 
 def format_game(game: dict, include_stats: bool = False) -> str:
@@ -46,38 +122,95 @@ def format_game(game: dict, include_stats: bool = False) -> str:
     date = game.get("date", "")
     
     # Format date if available
-    date_str = ""
-    if date:
-        try:
-            dt = datetime.fromisoformat(date.replace("Z", "+00:00"))
-            date_str = dt.strftime("%B %d, %Y at %I:%M %p")
-        except:
-            date_str = date
+    date_str = _format_game_date(date) if date else ""
+    
+    home_name = home_team.get("full_name", "Home Team")
+    visitor_name = visitor_team.get("full_name", "Away Team")
     
-    result = f"""
-{visitor_team.get("full_name", "Away Team")} @ {home_team.get("full_name", "Home Team")}
-Date: {date_str}
-Status: {status}
-"""
+    parts = [
+        f"{visitor_name} @ {home_name}",
+        f"Date: {date_str}",
+        f"Status: {status}",
+    ]
     
     if home_score is not None and visitor_score is not None:
-        result += f"Score: {visitor_team.get("abbreviation", "AWY")} {visitor_score} - {home_score} {home_team.get("abbreviation", "HME")}\n"
+        parts.append(f"Score: {visitor_team.get('abbreviation', 'AWY')} {visitor_score} - {home_score} {home_team.get('abbreviation', 'HME')}")
         
         # Determine winner
         if home_score > visitor_score:
-            result += f"Winner: {home_team.get("full_name", "Home Team")}\n"
+            parts.append(f"Winner: {home_name}")
         elif visitor_score > home_score:
-            result += f"Winner: {visitor_team.get("full_name", "Away Team")}\n"
+            parts.append(f"Winner: {visitor_name}")
         else:
-            result += "Result: Tie\n"
+            parts.append("Result: Tie")
     
-    if game.get("season"):
-        result += f"Season: {game.get("season")}\n"
+    season = game.get("season")
+    if season:
+        parts.append(f"Season: {season}")
     
     if game.get("postseason"):
-        result += "Playoff Game: Yes\n"
+        parts.append("Playoff Game: Yes")
     
-    return result.strip()
+    return "\n".join(parts)
+
+
+@dataclass(slots=True)
+class TeamStats:
+    """A team's win/loss record for the standings."""
+    name: str
+    conference: str
+    division: str
+    wins: int = 0
+    losses: int = 0
+    
+    @property
+    def win_pct(self) -> float:
+        total = self.wins + self.losses
+        return (self.wins / total * 100) if total > 0 else 0
+
+
+def _tally_games(games: list[dict], team_stats: dict[int, TeamStats]) -> None:
+    """Add the result of every completed game in a page of games to team_stats."""
+    finals = [game for game in games if game.get("status") == "Final"]
+    
+    for game in finals:
+        home = team_stats.get(game.get("home_team", {}).get("id"))
+        visitor = team_stats.get(game.get("visitor_team", {}).get("id"))
+        home_score = game.get("home_team_score")
+        visitor_score = game.get("visitor_team_score")
+        
+        if home is not None and visitor is not None and home_score is not None and visitor_score is not None:
+            if home_score > visitor_score:
+                home.wins += 1
+                visitor.losses += 1
+            else:
+                visitor.wins += 1
+                home.losses += 1
+
+
+# Lowercase full name / abbreviation / city / nickname -> team, built from
+# the (cached) /teams response and rebuilt only when that response changes
+_team_index: dict[str, dict] = {}
+_team_index_source: dict[str, Any] | None = None
+
+
+def _find_team(teams_data: dict[str, Any], team_name: str) -> dict | None:
+    """Find a team by exact name, abbreviation or city, then by substring."""
+    global _team_index_source
+    if teams_data is not _team_index_source:
+        _team_index.clear()
+        for team in teams_data.get("data", []):
+            for key in ("full_name", "abbreviation", "city", "name"):
+                value = team.get(key)
+                if value:
+                    _team_index.setdefault(value.lower(), team)
+        _team_index_source = teams_data
+    
+    team_name_lower = team_name.lower().strip()
+    matching_team = _team_index.get(team_name_lower)
+    if matching_team is None:
+        matching_team = next((team for key, team in _team_index.items() if team_name_lower in key), None)
+    return matching_team
 
 
 @mcp.tool()
@@ -110,11 +243,14 @@ async def get_games_by_date(date: str) -> str:
     Args:
         date: Date in YYYY-MM-DD format (e.g., 2024-01-15)
     """
+    # Validate date format, then that it is a real calendar date
+    invalid_date = f"Error: Invalid date format '{date}'. Please use YYYY-MM-DD format (e.g., 2024-01-15)."
+    if not DATE_PATTERN.match(date):
+        return invalid_date
     try:
-        # Validate date format
-        datetime.strptime(date, "%Y-%m-%d")
+        datetime.fromisoformat(date)
     except ValueError:
-        return f"Error: Invalid date format '{date}'. Please use YYYY-MM-DD format (e.g., 2024-01-15)."
+        return invalid_date
     
     url = f"{BALLDONTLIE_API_BASE}/games?dates[]={date}&per_page=100"
     
@@ -148,21 +284,7 @@ async def get_team_schedule(team_name: str, season: int = None) -> str:
         return "Error: Unable to fetch team information. The API may be temporarily unavailable."
     
     # Find matching team
-    team_name_lower = team_name.lower()
-    matching_team = None
-    
-    for team in teams_data.get("data", []):
-        full_name = team.get("full_name", "").lower()
-        abbreviation = team.get("abbreviation", "").lower()
-        city = team.get("city", "").lower()
-        name = team.get("name", "").lower()
-        
-        if (team_name_lower in full_name or 
-            team_name_lower == abbreviation or 
-            team_name_lower in city or 
-            team_name_lower in name):
-            matching_team = team
-            break
+    matching_team = _find_team(teams_data, team_name)
     
     if not matching_team:
         return f"Error: Team '{team_name}' not found. Please use a team name, city, or abbreviation (e.g., 'Lakers', 'LAL', 'Los Angeles Lakers')."
@@ -187,8 +309,8 @@ async def get_team_schedule(team_name: str, season: int = None) -> str:
     if not games:
         return f"No games found for {team_full_name} in the {season} season."
     
-    # Sort games by date
-    games.sort(key=lambda x: x.get("date", ""))
+    # Sort games by date (without mutating the cached response)
+    games = sorted(games, key=lambda x: x.get("date", ""))
     
     formatted_games = [format_game(game) for game in games[:20]]  # Limit to 20 most recent/upcoming
     remaining = len(games) - 20
@@ -211,96 +333,74 @@ async def get_standings(season: int = None) -> str:
     if season is None:
         season = datetime.now().year
     
-    # Get all teams
+    # Fetch all teams and the first page of the season's games concurrently
+    # (the API caps per_page at 100, so a season spans several pages)
     teams_url = f"{BALLDONTLIE_API_BASE}/teams?per_page=100"
-    teams_data = await make_api_request(teams_url)
+    games_url = f"{BALLDONTLIE_API_BASE}/games?seasons[]={season}&per_page=100"
+    teams_data, games_data = await asyncio.gather(
+        make_api_request(teams_url),
+        make_api_request(games_url),
+    )
     
     if not teams_data:
         return "Error: Unable to fetch team information. The API may be temporarily unavailable."
     
-    # Get games for the season to calculate standings
-    games_url = f"{BALLDONTLIE_API_BASE}/games?seasons[]={season}&per_page=1000"
-    games_data = await make_api_request(games_url)
-    
     if not games_data:
         return f"Error: Unable to fetch games for {season} season. The API may be temporarily unavailable."
     
     # Calculate standings from games
-    team_stats = {}
-    
-    for team in teams_data.get("data", []):
-        team_id = team.get("id")
-        team_stats[team_id] = {
-            "name": team.get("full_name"),
-            "conference": team.get("conference", "Unknown"),
-            "division": team.get("division", "Unknown"),
-            "wins": 0,
-            "losses": 0,
-        }
-    
-    # Process completed games
-    for game in games_data.get("data", []):
-        if game.get("status") != "Final":
-            continue
-        
-        home_id = game.get("home_team", {}).get("id")
-        visitor_id = game.get("visitor_team", {}).get("id")
-        home_score = game.get("home_team_score")
-        visitor_score = game.get("visitor_team_score")
-        
-        if home_id and visitor_id and home_score is not None and visitor_score is not None:
-            if home_score > visitor_score:
-                team_stats[home_id]["wins"] += 1
-                team_stats[visitor_id]["losses"] += 1
-            else:
-                team_stats[visitor_id]["wins"] += 1
-                team_stats[home_id]["losses"] += 1
-    
-    # Format standings by conference
-    east_teams = []
-    west_teams = []
-    
-    for team_id, stats in team_stats.items():
-        wins = stats["wins"]
-        losses = stats["losses"]
-        total = wins + losses
-        win_pct = (wins / total * 100) if total > 0 else 0
-        
-        team_info = {
-            "name": stats["name"],
-            "wins": wins,
-            "losses": losses,
-            "win_pct": win_pct,
-        }
-        
-        if stats["conference"] == "East":
-            east_teams.append(team_info)
-        elif stats["conference"] == "West":
-            west_teams.append(team_info)
-    
-    # Sort by wins
-    east_teams.sort(key=lambda x: (x["wins"], x["win_pct"]), reverse=True)
-    west_teams.sort(key=lambda x: (x["wins"], x["win_pct"]), reverse=True)
-    
-    result = f"NBA Standings - {season} Season\n\n"
-    result += "EASTERN CONFERENCE\n"
-    result += "-" * 50 + "\n"
-    
-    for i, team in enumerate(east_teams, 1):
-        result += f"{i}. {team['name']}: {team['wins']}-{team['losses']} ({team['win_pct']:.1f}%)\n"
-    
-    result += "\nWESTERN CONFERENCE\n"
-    result += "-" * 50 + "\n"
-    
-    for i, team in enumerate(west_teams, 1):
-        result += f"{i}. {team['name']}: {team['wins']}-{team['losses']} ({team['win_pct']:.1f}%)\n"
-    
-    return result
+    team_stats = {
+        team.get("id"): TeamStats(
+            name=team.get("full_name"),
+            conference=team.get("conference", "Unknown"),
+            division=team.get("division", "Unknown"),
+        )
+        for team in teams_data.get("data", [])
+    }
+    
+    # Tally each page as soon as it arrives, overlapping with the remaining downloads
+    _tally_games(games_data.get("data", []), team_stats)
+    
+    total_pages = games_data.get("meta", {}).get("total_pages") or 1
+    if total_pages > 1:
+        page_tasks = [
+            asyncio.create_task(make_api_request(f"{games_url}&page={page}"))
+            for page in range(2, total_pages + 1)
+        ]
+        try:
+            for next_page in asyncio.as_completed(page_tasks):
+                page_data = await next_page
+                if not page_data:
+                    return f"Error: Unable to fetch all games for {season} season. The API may be temporarily unavailable."
+                _tally_games(page_data.get("data", []), team_stats)
+        finally:
+            # Don't leave the other page requests running after an early return
+            for task in page_tasks:
+                task.cancel()
+    
+    # Split by conference and sort by wins
+    east_teams = [stats for stats in team_stats.values() if stats.conference == "East"]
+    west_teams = [stats for stats in team_stats.values() if stats.conference == "West"]
+    
+    sort_key = attrgetter("wins", "win_pct")
+    east_teams.sort(key=sort_key, reverse=True)
+    west_teams.sort(key=sort_key, reverse=True)
+    
+    lines = [f"NBA Standings - {season} Season"]
+    
+    for title, teams in (("EASTERN CONFERENCE", east_teams), ("WESTERN CONFERENCE", west_teams)):
+        lines += ["", title, "-" * 50]
+        lines += [
+            f"{i}. {team.name}: {team.wins}-{team.losses} ({team.win_pct:.1f}%)"
+            for i, team in enumerate(teams, 1)
+        ]
+    
+    return "\n".join(lines) + "\n"
 
 
 def main():
     # Initialize and run the server
-    mcp.run(transport="stdio")
+    run_server(mcp)
 
 
 if __name__ == "__main__":
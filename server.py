@@ -0,0 +1,28 @@
+from mcp.server.fastmcp import FastMCP
+
+from httpclient import lifespan, run_server
+from nba_scores import get_games_by_date, get_standings, get_team_schedule, get_today_games
+from weather import get_alerts, get_forecast
+
+# Combined server exposing the weather and NBA tools from one process, so they
+# share a single event loop and HTTP connection pool
+mcp = FastMCP("mcp-tests", lifespan=lifespan)
+
+for tool in (
+    get_alerts,
+    get_forecast,
+    get_today_games,
+    get_games_by_date,
+    get_team_schedule,
+    get_standings,
+):
+    mcp.add_tool(tool)
+
+
+def main():
+    # Initialize and run the server
+    run_server(mcp)
+
+
+if __name__ == "__main__":
+    main()
@@ -85,13 +85,13 @@ Write-Host "Upgrading pip..." -ForegroundColor Yellow
 # Install dependencies
 Write-Host ""
 Write-Host "Installing dependencies..." -ForegroundColor Yellow
-& $venvPython -m pip install "mcp[cli]>=1.2.0" httpx
+& $venvPython -m pip install "mcp[cli]>=1.3.0" "httpx[http2]"
 
 Write-Host ""
 Write-Host "Setup complete!" -ForegroundColor Green
 Write-Host ""
 Write-Host "Next steps:" -ForegroundColor Cyan
 Write-Host "1. Activate the virtual environment: .venv\Scripts\Activate.ps1" -ForegroundColor White
-Write-Host "2. Test the server: python weather.py" -ForegroundColor White
+Write-Host "2. Test the server: python server.py" -ForegroundColor White
 Write-Host "3. Configure Claude Desktop: .\generate_config.ps1" -ForegroundColor White
 Write-Host "4. Fully quit and restart Claude Desktop" -ForegroundColor White
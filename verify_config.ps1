@@ -1,8 +1,8 @@
 # Verify Claude Desktop Configuration
 # This script checks if your configuration is correct
 
-Write-Host "MCP Weather Server - Configuration Verifier" -ForegroundColor Cyan
-Write-Host "===========================================" -ForegroundColor Cyan
+Write-Host "MCP Servers - Configuration Verifier" -ForegroundColor Cyan
+Write-Host "====================================" -ForegroundColor Cyan
 Write-Host ""
 
 # Check Claude config file location
@@ -30,22 +30,31 @@ try {
     exit 1
 }
 
-# Check if weather server is configured
+# Check if the combined server (or the standalone weather server) is configured
 if (-not $config.mcpServers) {
     Write-Host "✗ No 'mcpServers' key found" -ForegroundColor Red
     exit 1
 }
 
-if (-not $config.mcpServers.weather) {
-    Write-Host "✗ No 'weather' server configured" -ForegroundColor Red
+$serverEntry = $config.mcpServers.'mcp-tests'
+$serverName = "mcp-tests"
+$scriptName = "server.py"
+if (-not $serverEntry) {
+    $serverEntry = $config.mcpServers.weather
+    $serverName = "weather"
+    $scriptName = "weather.py"
+}
+
+if (-not $serverEntry) {
+    Write-Host "✗ No 'mcp-tests' (server.py) or 'weather' (weather.py) server configured" -ForegroundColor Red
     exit 1
 }
 
-Write-Host "✓ Weather server configuration found" -ForegroundColor Green
+Write-Host "✓ '$serverName' server configuration found" -ForegroundColor Green
 Write-Host ""
 
 # Check Python command
-$pythonCmd = $config.mcpServers.weather.command
+$pythonCmd = $serverEntry.command
 Write-Host "Python command: $pythonCmd" -ForegroundColor Cyan
 
 if ($pythonCmd -eq "python") {
@@ -63,16 +72,16 @@ if ($pythonCmd -eq "python") {
 
 Write-Host ""
 
-# Check weather.py path
-$weatherPy = $config.mcpServers.weather.args[0]
-Write-Host "weather.py path: $weatherPy" -ForegroundColor Cyan
+# Check server script path
+$scriptPath = $serverEntry.args[0]
+Write-Host "$scriptName path: $scriptPath" -ForegroundColor Cyan
 
-if (Test-Path $weatherPy) {
-    Write-Host "✓ weather.py found at: $weatherPy" -ForegroundColor Green
+if (Test-Path $scriptPath) {
+    Write-Host "✓ $scriptName found at: $scriptPath" -ForegroundColor Green
 } else {
-    Write-Host "✗ weather.py NOT FOUND: $weatherPy" -ForegroundColor Red
+    Write-Host "✗ $scriptName NOT FOUND: $scriptPath" -ForegroundColor Red
     Write-Host "  Current directory: $(Get-Location)" -ForegroundColor Yellow
-    Write-Host "  Expected location: $(Join-Path (Get-Location) 'weather.py')" -ForegroundColor Yellow
+    Write-Host "  Expected location: $(Join-Path (Get-Location) $scriptName)" -ForegroundColor Yellow
 }
 
 Write-Host ""
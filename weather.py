@@ -1,11 +1,13 @@
+import asyncio
 import logging
 from typing import Any
 
-import httpx
 from mcp.server.fastmcp import FastMCP
 
+from httpclient import fetch_json, lifespan, run_server
+
 # Initialize FastMCP server
-mcp = FastMCP("weather")
+mcp = FastMCP("weather", lifespan=lifespan)
 
 # Set up logging to stderr (important for stdio servers)
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
@@ -14,25 +16,26 @@ logger = logging.getLogger(__name__)
 # Constants
 NWS_API_BASE = "https://api.weather.gov"
 USER_AGENT = "weather-app/1.0"
+NWS_HEADERS = {"User-Agent": USER_AGENT, "Accept": "application/geo+json"}
+
+# State, district and territory codes accepted by the NWS alerts endpoint
+US_STATE_CODES = frozenset({
+    "AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "FL", "GA",
+    "HI", "ID", "IL", "IN", "IA", "KS", "KY", "LA", "ME", "MD",
+    "MA", "MI", "MN", "MS", "MO", "MT", "NE", "NV", "NH", "NJ",
+    "NM", "NY", "NC", "ND", "OH", "OK", "OR", "PA", "RI", "SC",
+    "SD", "TN", "TX", "UT", "VT", "VA", "WA", "WV", "WI", "WY",
+    "DC", "AS", "GU", "MP", "PR", "VI",
+})
+
+# Per-host request limit, see httpclient.fetch_json
+_semaphore = asyncio.Semaphore(8)
 
 
 async def make_nws_request(url: str) -> dict[str, Any] | None:
     """Make a request to the NWS API with proper error handling."""
-    headers = {"User-Agent": USER_AGENT, "Accept": "application/geo+json"}
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(url, headers=headers, timeout=30.0)
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error {e.response.status_code} for {url}: {e.response.text[:200]}")
-            return None
-        except httpx.RequestError as e:
-            logger.error(f"Request error for {url}: {e}")
-            return None
-        except Exception as e:
-            logger.error(f"Unexpected error for {url}: {e}")
-            return None
+    result = await fetch_json(url, _semaphore, NWS_HEADERS)
+    return result[1] if result else None
 
 
 def format_alert(feature: dict) -> str:
@@ -54,9 +57,9 @@ async def get_alerts(state: str) -> str:
     Args:
         state: Two-letter US state code (e.g. CA, NY)
     """
-    # Validate state code format
+    # Validate state code
     state = state.upper().strip()
-    if len(state) != 2 or not state.isalpha():
+    if state not in US_STATE_CODES:
         return f"Error: Invalid state code '{state}'. Please use a two-letter US state code (e.g., CA, NY, TX)."
 
     url = f"{NWS_API_BASE}/alerts/active/area/{state}"
@@ -132,7 +135,7 @@ Forecast: {period["detailedForecast"]}
 
 def main():
     # Initialize and run the server
-    mcp.run(transport="stdio")
+    run_server(mcp)
 
 
 if __name__ == "__main__":